@@ -1,9 +1,14 @@
 """Automated Parking Lot System with GUI interface."""
 import tkinter as tk
 from tkinter import ttk, messagebox
+import math
+import string
+import sys
 import time
 from datetime import datetime
 import random
+from collections import Counter
+from contextlib import contextmanager
 from enum import Enum
 
 # Custom Exception for Parking Lot
@@ -19,116 +24,159 @@ class VehicleType(Enum):
     TRUCK = "Truck"
     SUV = "SUV"
 
+    # Members are singletons, so identity hashing is consistent with
+    # equality and keeps the per-type table lookups in C
+    __hash__ = object.__hash__
+
+# Color palettes and hourly rates per vehicle type
+_COLORS = {
+    VehicleType.CAR: ("#3498db", "#2980b9", "#1abc9c"),
+    VehicleType.BIKE: ("#e74c3c", "#c0392b", "#d35400"),
+    VehicleType.TRUCK: ("#f39c12", "#e67e22", "#d68910"),
+    VehicleType.SUV: ("#9b59b6", "#8e44ad", "#7d3c98")
+}
+
+# Short type label drawn on an occupied slot
+_TYPE_ABBR = {vehicle_type: vehicle_type.value[:3]
+              for vehicle_type in VehicleType}
+
+# Next palette entry to hand out per vehicle type
+_COLOR_IDX = Counter()
+
+_RATES = {
+    VehicleType.CAR: 2.0,
+    VehicleType.BIKE: 1.0,
+    VehicleType.TRUCK: 3.0,
+    VehicleType.SUV: 2.5
+}
+
 class Vehicle:
     """Base Vehicle class"""
+    __slots__ = ("vehicle_id", "vehicle_type", "owner_name", "entry_time",
+                 "entry_time_str", "slot_number", "color", "_type_str")
+
     def __init__(self, vehicle_id, vehicle_type, owner_name="Unknown"):
         self.vehicle_id = vehicle_id
         self.vehicle_type = vehicle_type
         self.owner_name = owner_name
         self.entry_time = None
+        self.entry_time_str = "N/A"
         self.slot_number = None
+        self._type_str = vehicle_type.value
         self.color = self.generate_color()
 
     def generate_color(self):
         """Generate a color based on vehicle type"""
-        colors = {
-            VehicleType.CAR: ["#3498db", "#2980b9", "#1abc9c"],
-            VehicleType.BIKE: ["#e74c3c", "#c0392b", "#d35400"],
-            VehicleType.TRUCK: ["#f39c12", "#e67e22", "#d68910"],
-            VehicleType.SUV: ["#9b59b6", "#8e44ad", "#7d3c98"]
-        }
-        return random.choice(colors.get(self.vehicle_type, ["#95a5a6"]))
+        palette = _COLORS.get(self.vehicle_type, ("#95a5a6",))
+        index = _COLOR_IDX[self.vehicle_type]
+        _COLOR_IDX[self.vehicle_type] = index + 1
+        return palette[index % len(palette)]
 
     def get_parking_fee(self, exit_time):
         """Calculate parking fee based on hours parked"""
         if not self.entry_time:
             return 0
 
-        hours_parked = (exit_time - self.entry_time).total_seconds() / 3600
-        hours_parked = max(1, hours_parked)
-        hours_parked = (hours_parked + 0.99) // 1
-
-        rates = {
-            VehicleType.CAR: 2.0,
-            VehicleType.BIKE: 1.0,
-            VehicleType.TRUCK: 3.0,
-            VehicleType.SUV: 2.5
-        }
+        # Bill every started hour, with a one hour minimum
+        seconds_parked = (exit_time - self.entry_time).total_seconds()
+        hours_parked = max(1, math.ceil(seconds_parked / 3600))
 
-        rate = rates.get(self.vehicle_type, 2.0)
+        rate = _RATES.get(self.vehicle_type, 2.0)
         return hours_parked * rate
 
     def to_dict(self):
         """Convert vehicle object to dictionary"""
         return {
             "id": self.vehicle_id,
-            "type": self.vehicle_type.value,
+            "type": self._type_str,
             "owner": self.owner_name,
-            "entry_time": (self.entry_time.strftime("%H:%M:%S")
-                           if self.entry_time else "N/A"),
+            "entry_time": self.entry_time_str,
             "slot": self.slot_number,
             "color": self.color
         }
 
 class Car(Vehicle):
     """Car vehicle type"""
+    __slots__ = ()
+
     def __init__(self, vehicle_id, owner_name="Unknown"):
         super().__init__(vehicle_id, VehicleType.CAR, owner_name)
 
 class Bike(Vehicle):
     """Bike vehicle type"""
+    __slots__ = ()
+
     def __init__(self, vehicle_id, owner_name="Unknown"):
         super().__init__(vehicle_id, VehicleType.BIKE, owner_name)
 
 class Truck(Vehicle):
     """Truck vehicle type"""
+    __slots__ = ()
+
     def __init__(self, vehicle_id, owner_name="Unknown"):
         super().__init__(vehicle_id, VehicleType.TRUCK, owner_name)
 
 class SUV(Vehicle):
     """SUV vehicle type"""
+    __slots__ = ()
+
     def __init__(self, vehicle_id, owner_name="Unknown"):
         super().__init__(vehicle_id, VehicleType.SUV, owner_name)
 
+# Vehicle class to construct for each vehicle type
+_VEHICLE_CTOR = {
+    VehicleType.CAR: Car,
+    VehicleType.BIKE: Bike,
+    VehicleType.TRUCK: Truck,
+    VehicleType.SUV: SUV
+}
+
 class ParkingLot:
     """Parking Lot class with limited capacity"""
     def __init__(self, capacity=5):
         self.capacity = capacity
         self.slots = [None] * capacity
+        self.free_mask = (1 << capacity) - 1
+        self.occupied_count = 0
         self.vehicles = {}
         self.hourly_rate = 2.0
         self.revenue = 0.0
         self.total_vehicles = 0
 
-    def park_vehicle(self, vehicle):
+    def park_vehicle(self, vehicle, entry_time=None):
         """Park a vehicle in the nearest empty slot"""
-        if self.is_full():
+        # Lowest set bit of the free mask is the nearest empty slot
+        lsb = self.free_mask & -self.free_mask
+        if not lsb:
             raise ParkingLotFullError()
 
-        for slot_number in range(self.capacity):
-            if self.slots[slot_number] is None:
-                vehicle.slot_number = slot_number + 1
-                vehicle.entry_time = datetime.now()
-                self.slots[slot_number] = vehicle
-                self.vehicles[vehicle.vehicle_id] = vehicle
-                self.total_vehicles += 1
-                return slot_number + 1
+        slot_index = lsb.bit_length() - 1
+        self.free_mask ^= lsb
 
-        raise ParkingLotFullError()
+        vehicle.slot_number = slot_index + 1
+        vehicle.entry_time = entry_time or datetime.now()
+        vehicle.entry_time_str = vehicle.entry_time.strftime("%H:%M:%S")
+        self.slots[slot_index] = vehicle
+        self.vehicles[vehicle.vehicle_id] = vehicle
+        self.occupied_count += 1
+        self.total_vehicles += 1
+        return slot_index + 1
 
-    def remove_vehicle(self, vehicle_id):
+    def remove_vehicle(self, vehicle_id, exit_time=None):
         """Remove a vehicle and calculate parking fee"""
         if vehicle_id not in self.vehicles:
             raise ValueError(f"Vehicle with ID {vehicle_id} not found")
 
         vehicle = self.vehicles[vehicle_id]
-        exit_time = datetime.now()
+        exit_time = exit_time or datetime.now()
 
         fee = vehicle.get_parking_fee(exit_time)
         self.revenue += fee
 
         if vehicle.slot_number:
             self.slots[vehicle.slot_number - 1] = None
+            self.free_mask |= 1 << (vehicle.slot_number - 1)
+            self.occupied_count -= 1
 
         del self.vehicles[vehicle_id]
 
@@ -136,24 +184,35 @@ class ParkingLot:
 
     def is_full(self):
         """Check if parking lot is full"""
-        return all(slot is not None for slot in self.slots)
+        return self.occupied_count == self.capacity
 
     def is_empty(self):
         """Check if parking lot is empty"""
-        return all(slot is None for slot in self.slots)
+        return self.occupied_count == 0
 
     def get_available_slots(self):
         """Get list of available slot numbers"""
-        return [i + 1 for i, slot in enumerate(self.slots) if slot is None]
+        available = []
+        mask = self.free_mask
+        while mask:
+            lsb = mask & -mask
+            available.append(lsb.bit_length())
+            mask ^= lsb
+        return available
 
     def get_occupied_slots(self):
         """Get list of occupied slot numbers"""
-        return [i + 1 for i, slot in enumerate(self.slots) if slot is not None]
+        occupied = []
+        mask = ~self.free_mask & ((1 << self.capacity) - 1)
+        while mask:
+            lsb = mask & -mask
+            occupied.append(lsb.bit_length())
+            mask ^= lsb
+        return occupied
 
     def get_occupancy_rate(self):
         """Get current occupancy rate as percentage"""
-        occupied = len(self.get_occupied_slots())
-        return (occupied / self.capacity) * 100
+        return self.occupied_count * 100.0 / self.capacity
 
     def get_slot_status(self, slot_number):
         """Get status of a specific slot"""
@@ -168,20 +227,81 @@ class ParkingLot:
     def reset(self):
         """Reset the parking lot"""
         self.slots = [None] * self.capacity
+        self.free_mask = (1 << self.capacity) - 1
+        self.occupied_count = 0
         self.vehicles.clear()
 
+# GUI color scheme and fonts
+COLOR_PRIMARY = "#3498db"
+COLOR_SECONDARY = "#2c3e50"
+COLOR_SUCCESS = "#2ecc71"
+COLOR_DANGER = "#e74c3c"
+COLOR_WARNING = "#f39c12"
+COLOR_INFO = "#1abc9c"
+COLOR_INFO_BAR = "#2980b9"
+COLOR_LIGHT = "#ecf0f1"
+COLOR_DARK = "#2c3e50"
+COLOR_EMPTY_SLOT = "#bdc3c7"
+COLOR_SLOT_BORDER = "#7f8c8d"
+
+FONT_TITLE = ("Segoe UI", 28, "bold")
+FONT_SUBTITLE = ("Segoe UI", 18, "bold")
+FONT_NORMAL = ("Segoe UI", 12)
+FONT_SMALL = ("Segoe UI", 10)
+
+# Vehicles removed per event loop pass during an emergency clear
+CLEAR_CHUNK_SIZE = 50
+
+# Name pools for generated owners
+_FIRST_NAMES = ("John", "Jane", "Robert", "Emily", "Michael",
+                "Sarah", "David", "Lisa")
+_LAST_NAMES = ("Smith", "Johnson", "Williams", "Brown", "Jones",
+               "Garcia", "Miller", "Davis")
+
+# Characters accepted in a vehicle ID entry
+_ID_CHARS = frozenset(string.ascii_letters + string.digits)
+
+def _random_vehicle_id():
+    """Generate a random ID of three letters and three digits"""
+    letters = ''.join(random.choices(string.ascii_uppercase, k=3))
+    numbers = ''.join(random.choices(string.digits, k=3))
+    return f"{letters}{numbers}"
+
+def _is_vehicle_id_text(text):
+    """Check that typed vehicle ID text holds only letters and digits"""
+    return all(char in _ID_CHARS for char in text)
+
+def _random_owner():
+    """Generate a random owner name"""
+    return f"{random.choice(_FIRST_NAMES)} {random.choice(_LAST_NAMES)}"
+
 class AutomatedParkingLotSystem:
     """GUI-based Automated Parking Lot System"""
     def __init__(self, root):
         self.root = root
         self.root.title("Automated Parking Lot System")
         self.root.state('zoomed')
-        self.root.configure(bg="#ecf0f1")
+        self.root.configure(bg=COLOR_LIGHT)
 
         self.parking_lot = ParkingLot(capacity=12)
 
         self.setup_styles()
 
+        # Last values pushed to the header labels
+        self._last_time_text = None
+        self._last_status = None
+
+        # Timestamp shared by everything handled within one event
+        self._now_cache = (float("-inf"), None)
+
+        # Display updates deferred while inside _batched()
+        self._batching = False
+        self._dirty_slots = set()
+        self._display_dirty = False
+
+        # Set while a stats refresh is waiting for the next idle cycle
+        self._stats_pending = False
+
         self.create_gui()
 
         self.initialize_demo_vehicles()
@@ -189,43 +309,37 @@ class AutomatedParkingLotSystem:
         self.update_real_time_info()
 
     def setup_styles(self):
-        """Setup color schemes and fonts"""
-        self.colors = {
-            "primary": "#3498db",
-            "secondary": "#2c3e50",
-            "success": "#2ecc71",
-            "danger": "#e74c3c",
-            "warning": "#f39c12",
-            "info": "#1abc9c",
-            "light": "#ecf0f1",
-            "dark": "#2c3e50",
-            "empty_slot": "#bdc3c7",
-            "slot_border": "#7f8c8d"
-        }
-
-        self.fonts = {
-            "title": ("Segoe UI", 28, "bold"),
-            "subtitle": ("Segoe UI", 18, "bold"),
-            "normal": ("Segoe UI", 12),
-            "small": ("Segoe UI", 10),
-            "mono": ("Courier New", 10)
-        }
+        """Setup ttk widget styles"""
+        self.style = ttk.Style(self.root)
+        # Fixed row height so rows are not measured one by one
+        self.style.configure("Vehicles.Treeview", rowheight=22)
+
+        self.style.configure("Receipt.TLabel", font=FONT_NORMAL,
+                             background=COLOR_LIGHT, foreground=COLOR_DARK)
+        self.style.configure("ReceiptTitle.TLabel",
+                             font=("Segoe UI", 20, "bold"),
+                             background=COLOR_LIGHT,
+                             foreground=COLOR_PRIMARY)
+        # Colors are left to the native theme, which ignores button
+        # backgrounds but would still apply a white foreground
+        self.style.configure("Receipt.TButton", font=FONT_NORMAL,
+                             padding=(20, 8))
 
     def create_gui(self):
         """Create the main GUI layout"""
-        main_container = tk.Frame(self.root, bg=self.colors["light"])
+        main_container = tk.Frame(self.root, bg=COLOR_LIGHT)
         main_container.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
 
         self.create_header(main_container)
 
-        content_frame = tk.Frame(main_container, bg=self.colors["light"])
+        content_frame = tk.Frame(main_container, bg=COLOR_LIGHT)
         content_frame.pack(fill=tk.BOTH, expand=True, pady=(20, 0))
 
-        left_frame = tk.Frame(content_frame, bg=self.colors["light"])
+        left_frame = tk.Frame(content_frame, bg=COLOR_LIGHT)
         left_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True,
                         padx=(0, 15))
 
-        right_frame = tk.Frame(content_frame, bg=self.colors["light"])
+        right_frame = tk.Frame(content_frame, bg=COLOR_LIGHT)
         right_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True,
                          padx=(15, 0))
 
@@ -236,29 +350,29 @@ class AutomatedParkingLotSystem:
 
     def create_header(self, parent):
         """Create application header"""
-        header_frame = tk.Frame(parent, bg=self.colors["primary"])
+        header_frame = tk.Frame(parent, bg=COLOR_PRIMARY)
         header_frame.pack(fill=tk.X, pady=(0, 20))
 
-        title_frame = tk.Frame(header_frame, bg=self.colors["primary"])
+        title_frame = tk.Frame(header_frame, bg=COLOR_PRIMARY)
         title_frame.pack(fill=tk.X, padx=30, pady=15)
 
         title_label = tk.Label(
             title_frame,
             text="Automated Parking Lot System",
-            font=self.fonts["title"],
-            bg=self.colors["primary"],
+            font=FONT_TITLE,
+            bg=COLOR_PRIMARY,
             fg="white"
         )
         title_label.pack(side=tk.LEFT)
 
-        self.info_bar = tk.Frame(header_frame, bg="#2980b9")
+        self.info_bar = tk.Frame(header_frame, bg=COLOR_INFO_BAR)
         self.info_bar.pack(fill=tk.X, padx=20, pady=(0, 10))
 
         self.time_label = tk.Label(
             self.info_bar,
             text="",
-            font=self.fonts["small"],
-            bg="#2980b9",
+            font=FONT_SMALL,
+            bg=COLOR_INFO_BAR,
             fg="white"
         )
         self.time_label.pack(side=tk.LEFT, padx=10, pady=5)
@@ -266,8 +380,8 @@ class AutomatedParkingLotSystem:
         self.status_label = tk.Label(
             self.info_bar,
             text="",
-            font=self.fonts["small"],
-            bg="#2980b9",
+            font=FONT_SMALL,
+            bg=COLOR_INFO_BAR,
             fg="white"
         )
         self.status_label.pack(side=tk.RIGHT, padx=10, pady=5)
@@ -277,9 +391,9 @@ class AutomatedParkingLotSystem:
         lot_frame = tk.LabelFrame(
             parent,
             text="Parking Lot Layout",
-            font=self.fonts["subtitle"],
-            bg=self.colors["light"],
-            fg=self.colors["secondary"],
+            font=FONT_SUBTITLE,
+            bg=COLOR_LIGHT,
+            fg=COLOR_SECONDARY,
             padx=20,
             pady=20
         )
@@ -291,12 +405,13 @@ class AutomatedParkingLotSystem:
             highlightthickness=0
         )
         self.parking_canvas.pack(fill=tk.BOTH, expand=True, pady=(10, 0))
+        self.parking_canvas.bind("<Configure>", self.draw_parking_lot)
 
-        legend_frame = tk.Frame(lot_frame, bg=self.colors["light"])
+        legend_frame = tk.Frame(lot_frame, bg=COLOR_LIGHT)
         legend_frame.pack(fill=tk.X, pady=(10, 0))
 
         legend_items = [
-            ("Empty Slot", self.colors["empty_slot"]),
+            ("Empty Slot", COLOR_EMPTY_SLOT),
             ("Car", "#3498db"),
             ("Bike", "#e74c3c"),
             ("Truck", "#f39c12"),
@@ -304,7 +419,7 @@ class AutomatedParkingLotSystem:
         ]
 
         for text, color in legend_items:
-            item_frame = tk.Frame(legend_frame, bg=self.colors["light"])
+            item_frame = tk.Frame(legend_frame, bg=COLOR_LIGHT)
             item_frame.pack(side=tk.LEFT, padx=10)
 
             color_box = tk.Label(
@@ -320,112 +435,144 @@ class AutomatedParkingLotSystem:
             text_label = tk.Label(
                 item_frame,
                 text=text,
-                font=self.fonts["small"],
-                bg=self.colors["light"],
-                fg=self.colors["dark"]
+                font=FONT_SMALL,
+                bg=COLOR_LIGHT,
+                fg=COLOR_DARK
             )
             text_label.pack(side=tk.LEFT)
 
         self.draw_parking_lot()
 
-    def draw_parking_lot(self):
-        """Draw the parking lot visualization"""
-        self.parking_canvas.delete("all")
+    def draw_parking_lot(self, event=None):
+        """Lay out the parking lot visualization for the current size"""
+        canvas = self.parking_canvas
+        canvas.delete("all")
+        self._slot_items = {}
 
-        canvas_width = self.parking_canvas.winfo_width()
-        canvas_height = self.parking_canvas.winfo_height()
+        canvas_width = canvas.winfo_width()
+        canvas_height = canvas.winfo_height()
 
         if canvas_width < 100 or canvas_height < 100:
             canvas_width = 600
             canvas_height = 400
 
-        rows = 3
-        cols = 4
-        slot_width = canvas_width // (cols + 2)
-        slot_height = canvas_height // (rows + 2)
+        self._slot_coords = self.compute_slot_coords(canvas_width,
+                                                     canvas_height)
+        self._slot_centers = [((x1 + x2) // 2, (y1 + y2) // 2)
+                              for x1, y1, x2, y2 in self._slot_coords]
+
+        create_rectangle = canvas.create_rectangle
+        create_text = canvas.create_text
+        type_font = ("Segoe UI", 10, "bold")
+        id_font = ("Segoe UI", 8)
+
+        for slot_num, (x1, y1, x2, y2) in enumerate(self._slot_coords, 1):
+            center_x = x1 + (x2 - x1) // 2
+
+            self._slot_items[slot_num] = {
+                "rect": create_rectangle(
+                    x1, y1, x2, y2,
+                    outline=COLOR_SLOT_BORDER,
+                    width=2
+                ),
+                "title": create_text(
+                    center_x, y1 + 20,
+                    justify=tk.CENTER
+                ),
+                "type": create_text(
+                    center_x, y1 + 40,
+                    font=type_font,
+                    fill="white"
+                ),
+                "id": create_text(
+                    center_x, y2 - 15,
+                    font=id_font,
+                    fill="white"
+                )
+            }
+
+            self.redraw_slot(slot_num)
 
-        for row in range(rows):
-            for col in range(cols):
-                slot_num = row * cols + col + 1
-                x1 = (col + 1) * slot_width
-                y1 = (row + 1) * slot_height
-                x2 = x1 + slot_width - 10
-                y2 = y1 + slot_height - 10
-
-                vehicle = self.parking_lot.get_slot_status(slot_num)
-
-                if vehicle:
-                    color = vehicle.color
-                    self.parking_canvas.create_rectangle(
-                        x1, y1, x2, y2,
-                        fill=color,
-                        outline=self.colors["slot_border"],
-                        width=2
-                    )
-
-                    self.parking_canvas.create_text(
-                        x1 + (x2 - x1) // 2,
-                        y1 + 20,
-                        text=f"Slot {slot_num}",
-                        font=("Segoe UI", 10, "bold"),
-                        fill="white"
-                    )
-
-                    self.parking_canvas.create_text(
-                        x1 + (x2 - x1) // 2,
-                        y1 + 40,
-                        text=vehicle.vehicle_type.value[:3],
-                        font=("Segoe UI", 10, "bold"),
-                        fill="white"
-                    )
-
-                    self.parking_canvas.create_text(
-                        x1 + (x2 - x1) // 2,
-                        y2 - 15,
-                        text=vehicle.vehicle_id,
-                        font=("Segoe UI", 8),
-                        fill="white"
-                    )
-                else:
-                    self.parking_canvas.create_rectangle(
-                        x1, y1, x2, y2,
-                        fill=self.colors["empty_slot"],
-                        outline=self.colors["slot_border"],
-                        width=2,
-                        dash=(5, 5)
-                    )
-
-                    self.parking_canvas.create_text(
-                        x1 + (x2 - x1) // 2,
-                        y1 + (y2 - y1) // 2,
-                        text=f"Slot {slot_num}\nEMPTY",
-                        font=("Segoe UI", 10),
-                        fill=self.colors["dark"],
-                        justify=tk.CENTER
-                    )
-
-        self.parking_canvas.create_text(
+        create_text(
             canvas_width // 2,
             20,
             text="ENTRY/EXIT",
             font=("Segoe UI", 12, "bold"),
-            fill=self.colors["primary"]
+            fill=COLOR_PRIMARY
         )
 
-        self.parking_canvas.create_rectangle(
+        create_rectangle(
             20, 40, canvas_width - 20, canvas_height - 20,
-            outline=self.colors["dark"],
+            outline=COLOR_DARK,
             width=3
         )
 
+    @staticmethod
+    def compute_slot_coords(canvas_width, canvas_height, rows=3, cols=4):
+        """Get the (x1, y1, x2, y2) box of every slot, in slot order"""
+        slot_width = canvas_width // (cols + 2)
+        slot_height = canvas_height // (rows + 2)
+
+        return [
+            ((col + 1) * slot_width, (row + 1) * slot_height,
+             (col + 2) * slot_width - 10, (row + 2) * slot_height - 10)
+            for row in range(rows)
+            for col in range(cols)
+        ]
+
+    def redraw_slot(self, slot_num):
+        """Update the canvas items of a single slot in place"""
+        items = self._slot_items.get(slot_num)
+        if not items:
+            return
+
+        canvas = self.parking_canvas
+        itemconfig = canvas.itemconfig
+        x1, y1, x2, y2 = self._slot_coords[slot_num - 1]
+        center_x = x1 + (x2 - x1) // 2
+
+        vehicle = self.parking_lot.get_slot_status(slot_num)
+
+        if vehicle:
+            itemconfig(items["rect"], fill=vehicle.color, dash="")
+
+            canvas.coords(items["title"], center_x, y1 + 20)
+            itemconfig(
+                items["title"],
+                text=f"Slot {slot_num}",
+                font=("Segoe UI", 10, "bold"),
+                fill="white"
+            )
+
+            itemconfig(items["type"],
+                       text=_TYPE_ABBR[vehicle.vehicle_type])
+            itemconfig(items["id"], text=vehicle.vehicle_id)
+        else:
+            itemconfig(
+                items["rect"],
+                fill=COLOR_EMPTY_SLOT,
+                dash=(5, 5)
+            )
+
+            canvas.coords(items["title"], center_x, y1 + (y2 - y1) // 2)
+            itemconfig(
+                items["title"],
+                text=f"Slot {slot_num}\nEMPTY",
+                font=("Segoe UI", 10),
+                fill=COLOR_DARK
+            )
+
+            itemconfig(items["type"], text="")
+            itemconfig(items["id"], text="")
+
     def create_vehicle_controls(self, parent):
         """Create vehicle parking/removal controls"""
         controls_frame = tk.LabelFrame(
             parent,
             text="Vehicle Management",
-            font=self.fonts["subtitle"],
-            bg=self.colors["light"],
-            fg=self.colors["secondary"],
+            font=FONT_SUBTITLE,
+            bg=COLOR_LIGHT,
+            fg=COLOR_SECONDARY,
             padx=20,
             pady=20
         )
@@ -434,29 +581,29 @@ class AutomatedParkingLotSystem:
         notebook = ttk.Notebook(controls_frame)
         notebook.pack(fill=tk.BOTH, expand=True)
 
-        park_frame = tk.Frame(notebook, bg=self.colors["light"])
+        park_frame = tk.Frame(notebook, bg=COLOR_LIGHT)
         notebook.add(park_frame, text="Park Vehicle")
         self.create_park_controls(park_frame)
 
-        remove_frame = tk.Frame(notebook, bg=self.colors["light"])
+        remove_frame = tk.Frame(notebook, bg=COLOR_LIGHT)
         notebook.add(remove_frame, text="Remove Vehicle")
         self.create_remove_controls(remove_frame)
 
-        quick_frame = tk.Frame(notebook, bg=self.colors["light"])
+        quick_frame = tk.Frame(notebook, bg=COLOR_LIGHT)
         notebook.add(quick_frame, text="Quick Actions")
         self.create_quick_controls(quick_frame)
 
     def create_park_controls(self, parent):
         """Create controls for parking vehicles"""
-        type_frame = tk.Frame(parent, bg=self.colors["light"])
+        type_frame = tk.Frame(parent, bg=COLOR_LIGHT)
         type_frame.pack(fill=tk.X, pady=10)
 
         tk.Label(
             type_frame,
             text="Vehicle Type:",
-            font=self.fonts["normal"],
-            bg=self.colors["light"],
-            fg=self.colors["dark"],
+            font=FONT_NORMAL,
+            bg=COLOR_LIGHT,
+            fg=COLOR_DARK,
             width=15,
             anchor="w"
         ).pack(side=tk.LEFT)
@@ -471,23 +618,27 @@ class AutomatedParkingLotSystem:
         )
         type_combo.pack(side=tk.LEFT, padx=(10, 0))
 
-        id_frame = tk.Frame(parent, bg=self.colors["light"])
+        id_frame = tk.Frame(parent, bg=COLOR_LIGHT)
         id_frame.pack(fill=tk.X, pady=10)
 
         tk.Label(
             id_frame,
             text="Vehicle ID:",
-            font=self.fonts["normal"],
-            bg=self.colors["light"],
-            fg=self.colors["dark"],
+            font=FONT_NORMAL,
+            bg=COLOR_LIGHT,
+            fg=COLOR_DARK,
             width=15,
             anchor="w"
         ).pack(side=tk.LEFT)
 
+        self.vehicle_id_var = self.create_vehicle_id_var()
         self.vehicle_id_entry = tk.Entry(
             id_frame,
-            font=self.fonts["normal"],
-            width=20
+            textvariable=self.vehicle_id_var,
+            font=FONT_NORMAL,
+            width=20,
+            validate="key",
+            validatecommand=(self.root.register(_is_vehicle_id_text), "%P")
         )
         self.vehicle_id_entry.pack(side=tk.LEFT, padx=(10, 0))
 
@@ -496,28 +647,28 @@ class AutomatedParkingLotSystem:
             text="Random",
             command=self.generate_random_id,
             font=("Segoe UI", 10),
-            bg=self.colors["warning"],
+            bg=COLOR_WARNING,
             fg="white",
             width=8
         )
         random_id_btn.pack(side=tk.LEFT, padx=(5, 0))
 
-        owner_frame = tk.Frame(parent, bg=self.colors["light"])
+        owner_frame = tk.Frame(parent, bg=COLOR_LIGHT)
         owner_frame.pack(fill=tk.X, pady=10)
 
         tk.Label(
             owner_frame,
             text="Owner Name:",
-            font=self.fonts["normal"],
-            bg=self.colors["light"],
-            fg=self.colors["dark"],
+            font=FONT_NORMAL,
+            bg=COLOR_LIGHT,
+            fg=COLOR_DARK,
             width=15,
             anchor="w"
         ).pack(side=tk.LEFT)
 
         self.owner_name_entry = tk.Entry(
             owner_frame,
-            font=self.fonts["normal"],
+            font=FONT_NORMAL,
             width=20
         )
         self.owner_name_entry.pack(side=tk.LEFT, padx=(10, 0))
@@ -527,9 +678,9 @@ class AutomatedParkingLotSystem:
             text="Park Vehicle",
             command=self.park_vehicle,
             font=("Segoe UI", 14, "bold"),
-            bg=self.colors["success"],
+            bg=COLOR_SUCCESS,
             fg="white",
-            activebackground=self.colors["success"],
+            activebackground=COLOR_SUCCESS,
             activeforeground="white",
             relief=tk.RAISED,
             bd=3,
@@ -541,44 +692,60 @@ class AutomatedParkingLotSystem:
         self.park_status_label = tk.Label(
             parent,
             text="Enter vehicle details to park",
-            font=self.fonts["small"],
-            bg=self.colors["light"],
-            fg=self.colors["dark"],
+            font=FONT_SMALL,
+            bg=COLOR_LIGHT,
+            fg=COLOR_DARK,
             wraplength=300
         )
         self.park_status_label.pack(pady=(0, 10))
 
+    def create_vehicle_id_var(self):
+        """Create a StringVar that keeps vehicle IDs upper case as typed"""
+        var = tk.StringVar()
+
+        def normalize(*_):
+            value = var.get()
+            if value != value.upper():
+                var.set(value.upper())
+
+        var.trace_add("write", normalize)
+        return var
+
     def create_remove_controls(self, parent):
         """Create controls for removing vehicles"""
-        id_frame = tk.Frame(parent, bg=self.colors["light"])
+        id_frame = tk.Frame(parent, bg=COLOR_LIGHT)
         id_frame.pack(fill=tk.X, pady=10)
 
         tk.Label(
             id_frame,
             text="Vehicle ID to remove:",
-            font=self.fonts["normal"],
-            bg=self.colors["light"],
-            fg=self.colors["dark"],
+            font=FONT_NORMAL,
+            bg=COLOR_LIGHT,
+            fg=COLOR_DARK,
             width=20,
             anchor="w"
         ).pack(side=tk.LEFT)
 
+        self.remove_id_var = self.create_vehicle_id_var()
         self.remove_id_entry = tk.Entry(
             id_frame,
-            font=self.fonts["normal"],
-            width=20
+            textvariable=self.remove_id_var,
+            font=FONT_NORMAL,
+            width=20,
+            validate="key",
+            validatecommand=(self.root.register(_is_vehicle_id_text), "%P")
         )
         self.remove_id_entry.pack(side=tk.LEFT, padx=(10, 0))
 
-        slot_frame = tk.Frame(parent, bg=self.colors["light"])
+        slot_frame = tk.Frame(parent, bg=COLOR_LIGHT)
         slot_frame.pack(fill=tk.X, pady=10)
 
         tk.Label(
             slot_frame,
             text="Or select slot:",
-            font=self.fonts["normal"],
-            bg=self.colors["light"],
-            fg=self.colors["dark"],
+            font=FONT_NORMAL,
+            bg=COLOR_LIGHT,
+            fg=COLOR_DARK,
             width=20,
             anchor="w"
         ).pack(side=tk.LEFT)
@@ -600,9 +767,9 @@ class AutomatedParkingLotSystem:
             text="Remove Vehicle",
             command=self.remove_vehicle,
             font=("Segoe UI", 14, "bold"),
-            bg=self.colors["danger"],
+            bg=COLOR_DANGER,
             fg="white",
-            activebackground=self.colors["danger"],
+            activebackground=COLOR_DANGER,
             activeforeground="white",
             relief=tk.RAISED,
             bd=3,
@@ -614,9 +781,9 @@ class AutomatedParkingLotSystem:
         self.remove_status_label = tk.Label(
             parent,
             text="Enter vehicle ID or select slot to remove",
-            font=self.fonts["small"],
-            bg=self.colors["light"],
-            fg=self.colors["dark"],
+            font=FONT_SMALL,
+            bg=COLOR_LIGHT,
+            fg=COLOR_DARK,
             wraplength=300
         )
         self.remove_status_label.pack(pady=(0, 10))
@@ -625,30 +792,30 @@ class AutomatedParkingLotSystem:
             parent,
             text="",
             font=("Segoe UI", 12, "bold"),
-            bg=self.colors["light"],
-            fg=self.colors["primary"]
+            bg=COLOR_LIGHT,
+            fg=COLOR_PRIMARY
         )
         self.fee_label.pack()
 
     def create_quick_controls(self, parent):
         """Create quick action controls"""
-        quick_park_frame = tk.Frame(parent, bg=self.colors["light"])
+        quick_park_frame = tk.Frame(parent, bg=COLOR_LIGHT)
         quick_park_frame.pack(fill=tk.X, pady=10)
 
         tk.Label(
             quick_park_frame,
             text="Quick Park:",
-            font=self.fonts["normal"],
-            bg=self.colors["light"],
-            fg=self.colors["dark"],
+            font=FONT_NORMAL,
+            bg=COLOR_LIGHT,
+            fg=COLOR_DARK,
             anchor="w"
         ).pack(fill=tk.X, pady=(0, 5))
 
         vehicle_types = [
-            ("Car", VehicleType.CAR, self.colors["primary"]),
-            ("Bike", VehicleType.BIKE, self.colors["danger"]),
-            ("Truck", VehicleType.TRUCK, self.colors["warning"]),
-            ("SUV", VehicleType.SUV, self.colors["info"])
+            ("Car", VehicleType.CAR, COLOR_PRIMARY),
+            ("Bike", VehicleType.BIKE, COLOR_DANGER),
+            ("Truck", VehicleType.TRUCK, COLOR_WARNING),
+            ("SUV", VehicleType.SUV, COLOR_INFO)
         ]
 
         for text, v_type, color in vehicle_types:
@@ -656,7 +823,7 @@ class AutomatedParkingLotSystem:
                 quick_park_frame,
                 text=text,
                 command=lambda vt=v_type: self.quick_park(vt),
-                font=self.fonts["normal"],
+                font=FONT_NORMAL,
                 bg=color,
                 fg="white",
                 activebackground=color,
@@ -668,15 +835,15 @@ class AutomatedParkingLotSystem:
             )
             btn.pack(side=tk.LEFT, padx=2)
 
-        emergency_frame = tk.Frame(parent, bg=self.colors["light"])
+        emergency_frame = tk.Frame(parent, bg=COLOR_LIGHT)
         emergency_frame.pack(fill=tk.X, pady=(20, 10))
 
         emergency_btn = tk.Button(
             emergency_frame,
             text="Emergency Clear All",
             command=self.emergency_clear,
-            font=self.fonts["normal"],
-            bg="#e74c3c",
+            font=FONT_NORMAL,
+            bg=COLOR_DANGER,
             fg="white",
             activebackground="#c0392b",
             activeforeground="white",
@@ -687,14 +854,14 @@ class AutomatedParkingLotSystem:
         )
         emergency_btn.pack(fill=tk.X)
 
-        reset_frame = tk.Frame(parent, bg=self.colors["light"])
+        reset_frame = tk.Frame(parent, bg=COLOR_LIGHT)
         reset_frame.pack(fill=tk.X, pady=(10, 0))
 
         reset_btn = tk.Button(
             reset_frame,
             text="Reset Parking Lot",
             command=self.reset_parking_lot,
-            font=self.fonts["normal"],
+            font=FONT_NORMAL,
             bg="#95a5a6",
             fg="white",
             activebackground="#7f8c8d",
@@ -711,44 +878,44 @@ class AutomatedParkingLotSystem:
         stats_frame = tk.LabelFrame(
             parent,
             text="Parking Statistics",
-            font=self.fonts["subtitle"],
-            bg=self.colors["light"],
-            fg=self.colors["secondary"],
+            font=FONT_SUBTITLE,
+            bg=COLOR_LIGHT,
+            fg=COLOR_SECONDARY,
             padx=20,
             pady=20
         )
         stats_frame.pack(fill=tk.X, pady=(0, 20))
 
-        stats_grid = tk.Frame(stats_frame, bg=self.colors["light"])
+        stats_grid = tk.Frame(stats_frame, bg=COLOR_LIGHT)
         stats_grid.pack(fill=tk.BOTH, expand=True)
 
         self.create_stat_box(stats_grid, 0, 0, "Total Capacity",
                              str(self.parking_lot.capacity),
-                             self.colors["primary"])
+                             COLOR_PRIMARY)
 
         self.available_slots_var = tk.StringVar(value="12")
         self.create_stat_box(stats_grid, 0, 1, "Available Slots", "12",
-                             self.colors["success"],
+                             COLOR_SUCCESS,
                              var=self.available_slots_var)
 
         self.occupied_slots_var = tk.StringVar(value="0")
         self.create_stat_box(stats_grid, 1, 0, "Occupied Slots", "0",
-                             self.colors["danger"],
+                             COLOR_DANGER,
                              var=self.occupied_slots_var)
 
         self.occupancy_var = tk.StringVar(value="0%")
         self.create_stat_box(stats_grid, 1, 1, "Occupancy Rate", "0%",
-                             self.colors["warning"],
+                             COLOR_WARNING,
                              var=self.occupancy_var)
 
         self.revenue_var = tk.StringVar(value="$0.00")
         self.create_stat_box(stats_grid, 2, 0, "Total Revenue", "$0.00",
-                             self.colors["info"],
+                             COLOR_INFO,
                              var=self.revenue_var)
 
         self.total_vehicles_var = tk.StringVar(value="0")
         self.create_stat_box(stats_grid, 2, 1, "Total Parked", "0",
-                             self.colors["secondary"],
+                             COLOR_SECONDARY,
                              var=self.total_vehicles_var)
 
         for i in range(3):
@@ -759,14 +926,14 @@ class AutomatedParkingLotSystem:
     def create_stat_box(self, parent, row, col, title, value, color,
                         var=None):
         """Create a statistic box"""
-        box_frame = tk.Frame(parent, bg=self.colors["light"],
+        box_frame = tk.Frame(parent, bg=COLOR_LIGHT,
                              relief=tk.RAISED, bd=2)
         box_frame.grid(row=row, column=col, padx=5, pady=5, sticky="nsew")
 
         title_label = tk.Label(
             box_frame,
             text=title,
-            font=self.fonts["small"],
+            font=FONT_SMALL,
             bg=color,
             fg="white",
             pady=5
@@ -778,7 +945,7 @@ class AutomatedParkingLotSystem:
                 box_frame,
                 textvariable=var,
                 font=("Segoe UI", 20, "bold"),
-                bg=self.colors["light"],
+                bg=COLOR_LIGHT,
                 fg=color,
                 pady=10
             )
@@ -787,7 +954,7 @@ class AutomatedParkingLotSystem:
                 box_frame,
                 text=value,
                 font=("Segoe UI", 20, "bold"),
-                bg=self.colors["light"],
+                bg=COLOR_LIGHT,
                 fg=color,
                 pady=10
             )
@@ -798,9 +965,9 @@ class AutomatedParkingLotSystem:
         list_frame = tk.LabelFrame(
             parent,
             text="Currently Parked Vehicles",
-            font=self.fonts["subtitle"],
-            bg=self.colors["light"],
-            fg=self.colors["secondary"],
+            font=FONT_SUBTITLE,
+            bg=COLOR_LIGHT,
+            fg=COLOR_SECONDARY,
             padx=20,
             pady=20
         )
@@ -811,8 +978,11 @@ class AutomatedParkingLotSystem:
             list_frame,
             columns=columns,
             show="headings",
-            height=8
+            height=8,
+            style="Vehicles.Treeview"
         )
+        # Tree row id for each listed vehicle id
+        self._tree_iids = {}
 
         self.vehicles_tree.heading("slot", text="Slot")
         self.vehicles_tree.heading("id", text="Vehicle ID")
@@ -842,69 +1012,87 @@ class AutomatedParkingLotSystem:
             ("SUV321", VehicleType.SUV, "Carol Davis")
         ]
 
-        for vehicle_id, vehicle_type, owner in demo_vehicles:
-            if vehicle_type == VehicleType.CAR:
-                vehicle = Car(vehicle_id, owner)
-            elif vehicle_type == VehicleType.BIKE:
-                vehicle = Bike(vehicle_id, owner)
-            elif vehicle_type == VehicleType.TRUCK:
-                vehicle = Truck(vehicle_id, owner)
-            elif vehicle_type == VehicleType.SUV:
-                vehicle = SUV(vehicle_id, owner)
+        with self._batched():
+            for vehicle_id, vehicle_type, owner in demo_vehicles:
+                vehicle = _VEHICLE_CTOR[vehicle_type](vehicle_id, owner)
 
-            try:
-                self.parking_lot.park_vehicle(vehicle)
-            except ParkingLotFullError:
-                break
+                try:
+                    self.parking_lot.park_vehicle(vehicle, self._now())
+                except ParkingLotFullError:
+                    break
 
-        self.update_display()
+                self._apply_park(vehicle)
 
     def update_real_time_info(self):
-        """Update real-time information"""
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.time_label.config(text=f"{current_time}")
+        """Update the clock once per second"""
+        if self.root.state() in ("iconic", "withdrawn"):
+            # Nothing is visible, so just keep the tick alive
+            self.root.after(1000, self.update_real_time_info)
+            return
+
+        now = datetime.now()
+        self._now_cache = (time.monotonic(), now)
+        current_time = now.strftime("%Y-%m-%d %H:%M:%S")
+        if current_time != self._last_time_text:
+            self._last_time_text = current_time
+            self.time_label.config(text=current_time)
+
+        # Wake up just after the next second boundary
+        self.root.after(1000 - now.microsecond // 1000,
+                        self.update_real_time_info)
+
+    def _now(self):
+        """Get the current time, reusing it for a quarter of a second"""
+        tick = time.monotonic()
+        if tick - self._now_cache[0] > 0.25:
+            self._now_cache = (tick, datetime.now())
+        return self._now_cache[1]
+
+    def update_status(self):
+        """Update the occupancy status in the header"""
+        status_key = (self.parking_lot.occupied_count,
+                      self.parking_lot.capacity)
+        if status_key == self._last_status:
+            return
+        self._last_status = status_key
 
         if self.parking_lot.is_full():
             status = "FULL"
-            status_color = "#e74c3c"
+            status_color = COLOR_DANGER
         elif self.parking_lot.is_empty():
             status = "EMPTY"
-            status_color = "#2ecc71"
+            status_color = COLOR_SUCCESS
         else:
             occupied = self.parking_lot.get_total_vehicles_parked()
             status = f"{occupied}/{self.parking_lot.capacity}"
-            status_color = "#f39c12"
+            status_color = COLOR_WARNING
 
         self.status_label.config(text=status, fg=status_color)
 
-        self.root.after(1000, self.update_real_time_info)
+    @staticmethod
+    def _set_var(var, value):
+        """Set a Tk variable only if its value changed"""
+        if var.get() != value:
+            var.set(value)
 
     def generate_random_id(self):
         """Generate random vehicle ID"""
-        letters = ''.join(random.choices('ABCDEFGHIJKLMNOPQRSTUVWXYZ', k=3))
-        numbers = ''.join(random.choices('0123456789', k=3))
-        vehicle_id = f"{letters}{numbers}"
         self.vehicle_id_entry.delete(0, tk.END)
-        self.vehicle_id_entry.insert(0, vehicle_id)
+        self.vehicle_id_entry.insert(0, _random_vehicle_id())
 
-        first_names = ["John", "Jane", "Robert", "Emily", "Michael",
-                       "Sarah", "David", "Lisa"]
-        last_names = ["Smith", "Johnson", "Williams", "Brown", "Jones",
-                      "Garcia", "Miller", "Davis"]
-        owner = f"{random.choice(first_names)} {random.choice(last_names)}"
         self.owner_name_entry.delete(0, tk.END)
-        self.owner_name_entry.insert(0, owner)
+        self.owner_name_entry.insert(0, _random_owner())
 
     def park_vehicle(self):
         """Park a vehicle in the parking lot"""
-        vehicle_id = self.vehicle_id_entry.get().strip().upper()
+        vehicle_id = sys.intern(self.vehicle_id_var.get())
         owner_name = self.owner_name_entry.get().strip()
         vehicle_type_str = self.vehicle_type_var.get()
 
         if not vehicle_id:
             self.park_status_label.config(
                 text="Please enter a vehicle ID",
-                fg=self.colors["danger"]
+                fg=COLOR_DANGER
             )
             return
 
@@ -914,28 +1102,22 @@ class AutomatedParkingLotSystem:
         if vehicle_id in self.parking_lot.vehicles:
             self.park_status_label.config(
                 text=f"Vehicle {vehicle_id} is already parked!",
-                fg=self.colors["danger"]
+                fg=COLOR_DANGER
             )
             return
 
         vehicle_type = VehicleType(vehicle_type_str)
-        if vehicle_type == VehicleType.CAR:
-            vehicle = Car(vehicle_id, owner_name)
-        elif vehicle_type == VehicleType.BIKE:
-            vehicle = Bike(vehicle_id, owner_name)
-        elif vehicle_type == VehicleType.TRUCK:
-            vehicle = Truck(vehicle_id, owner_name)
-        elif vehicle_type == VehicleType.SUV:
-            vehicle = SUV(vehicle_id, owner_name)
+        vehicle = _VEHICLE_CTOR[vehicle_type](vehicle_id, owner_name)
 
         try:
-            slot_number = self.parking_lot.park_vehicle(vehicle)
-
-            self.update_display()
+            with self._batched():
+                slot_number = self.parking_lot.park_vehicle(
+                    vehicle, self._now())
+                self._apply_park(vehicle)
 
             self.park_status_label.config(
                 text=f"Vehicle {vehicle_id} parked in Slot {slot_number}",
-                fg=self.colors["success"]
+                fg=COLOR_SUCCESS
             )
 
             self.vehicle_id_entry.delete(0, tk.END)
@@ -946,42 +1128,33 @@ class AutomatedParkingLotSystem:
         except ParkingLotFullError as error_msg:
             self.park_status_label.config(
                 text=f"No available slots!",
-                fg=self.colors["danger"]
+                fg=COLOR_DANGER
             )
 
     def animate_parking(self, slot_number):
         """Animate parking action"""
-        canvas_width = self.parking_canvas.winfo_width()
-        canvas_height = self.parking_canvas.winfo_height()
-
-        if canvas_width > 100:
-            rows = 3
-            cols = 4
-            slot_width = canvas_width // (cols + 2)
-            slot_height = canvas_height // (rows + 2)
-
-            row = (slot_number - 1) // cols
-            col = (slot_number - 1) % cols
-
-            x = (col + 1) * slot_width + slot_width // 2
-            y = (row + 1) * slot_height + slot_height // 2
-
-            highlight = self.parking_canvas.create_oval(
-                x-20, y-20, x+20, y+20,
-                fill="yellow",
-                outline="orange",
-                width=3
-            )
+        x, y = self._slot_centers[slot_number - 1]
 
-            for _ in range(3):
-                self.parking_canvas.itemconfig(highlight, fill="yellow")
-                self.root.update()
-                time.sleep(0.1)
-                self.parking_canvas.itemconfig(highlight, fill="orange")
-                self.root.update()
-                time.sleep(0.1)
+        highlight = self.parking_canvas.create_oval(
+            x-20, y-20, x+20, y+20,
+            fill="yellow",
+            outline="orange",
+            width=3
+        )
+
+        self._animate_step(highlight, 0)
 
+    def _animate_step(self, highlight, step):
+        """Blink the parking highlight, scheduling the next step"""
+        if step == 6:
             self.parking_canvas.delete(highlight)
+            return
+
+        self.parking_canvas.itemconfig(
+            highlight,
+            fill="yellow" if step % 2 == 0 else "orange"
+        )
+        self.root.after(100, self._animate_step, highlight, step + 1)
 
     def on_slot_selected(self, event):
         """When a slot is selected in the combo box"""
@@ -995,38 +1168,39 @@ class AutomatedParkingLotSystem:
                 self.remove_status_label.config(
                     text=f"Found: {vehicle.vehicle_id} "
                          f"({vehicle.vehicle_type.value})",
-                    fg=self.colors["info"]
+                    fg=COLOR_INFO
                 )
             else:
                 self.remove_status_label.config(
                     text=f"Slot {slot_num} is empty",
-                    fg=self.colors["warning"]
+                    fg=COLOR_WARNING
                 )
 
     def remove_vehicle(self):
         """Remove a vehicle from the parking lot"""
-        vehicle_id = self.remove_id_entry.get().strip().upper()
+        vehicle_id = sys.intern(self.remove_id_var.get())
 
         if not vehicle_id:
             self.remove_status_label.config(
                 text="Please enter a vehicle ID",
-                fg=self.colors["danger"]
+                fg=COLOR_DANGER
             )
             return
 
         try:
-            vehicle, fee = self.parking_lot.remove_vehicle(vehicle_id)
-
-            self.update_display()
+            with self._batched():
+                vehicle, fee = self.parking_lot.remove_vehicle(
+                    vehicle_id, self._now())
+                self._apply_remove(vehicle)
 
             self.remove_status_label.config(
                 text=f"Vehicle {vehicle_id} removed",
-                fg=self.colors["success"]
+                fg=COLOR_SUCCESS
             )
 
             self.fee_label.config(
                 text=f"Parking Fee: ${fee:.2f}",
-                fg=self.colors["primary"]
+                fg=COLOR_PRIMARY
             )
 
             self.show_receipt(vehicle, fee)
@@ -1037,7 +1211,7 @@ class AutomatedParkingLotSystem:
         except ValueError as error_msg:
             self.remove_status_label.config(
                 text=f"{str(error_msg)}",
-                fg=self.colors["danger"]
+                fg=COLOR_DANGER
             )
             self.fee_label.config(text="")
 
@@ -1046,7 +1220,7 @@ class AutomatedParkingLotSystem:
         receipt_window = tk.Toplevel(self.root)
         receipt_window.title("Parking Receipt")
         receipt_window.geometry("400x300")
-        receipt_window.configure(bg=self.colors["light"])
+        receipt_window.configure(bg=COLOR_LIGHT)
         receipt_window.transient(self.root)
 
         receipt_window.update_idletasks()
@@ -1054,75 +1228,54 @@ class AutomatedParkingLotSystem:
         y = (self.root.winfo_y() + (self.root.winfo_height() // 2) - 150)
         receipt_window.geometry(f"+{x}+{y}")
 
-        content_frame = tk.Frame(receipt_window, bg=self.colors["light"],
+        content_frame = tk.Frame(receipt_window, bg=COLOR_LIGHT,
                                  padx=30, pady=30)
         content_frame.pack(fill=tk.BOTH, expand=True)
 
-        tk.Label(
+        ttk.Label(
             content_frame,
             text="PARKING RECEIPT",
-            font=("Segoe UI", 20, "bold"),
-            bg=self.colors["light"],
-            fg=self.colors["primary"]
+            style="ReceiptTitle.TLabel"
         ).pack(pady=(0, 20))
 
-        details = [
-            f"Vehicle ID: {vehicle.vehicle_id}",
-            f"Vehicle Type: {vehicle.vehicle_type.value}",
-            f"Owner: {vehicle.owner_name}",
-            f"Slot: {vehicle.slot_number}",
-            f"Entry Time: {vehicle.entry_time.strftime('%H:%M:%S') if vehicle.entry_time else 'N/A'}",
-            f"Exit Time: {datetime.now().strftime('%H:%M:%S')}",
-            "",
-            f"Parking Fee: ${fee:.2f}",
+        exit_time = self._now().strftime("%H:%M:%S")
+        details = (
+            f"Vehicle ID: {vehicle.vehicle_id}\n"
+            f"Vehicle Type: {vehicle.vehicle_type.value}\n"
+            f"Owner: {vehicle.owner_name}\n"
+            f"Slot: {vehicle.slot_number}\n"
+            f"Entry Time: {vehicle.entry_time_str}\n"
+            f"Exit Time: {exit_time}\n"
+            "\n"
+            f"Parking Fee: ${fee:.2f}\n"
             "Thank you for parking with us!"
-        ]
+        )
 
-        for detail in details:
-            tk.Label(
-                content_frame,
-                text=detail,
-                font=self.fonts["normal"],
-                bg=self.colors["light"],
-                fg=self.colors["dark"]
-            ).pack(anchor="w", pady=2)
+        ttk.Label(
+            content_frame,
+            text=details,
+            style="Receipt.TLabel",
+            justify=tk.LEFT
+        ).pack(anchor="w")
 
-        tk.Button(
+        ttk.Button(
             content_frame,
             text="Close",
             command=receipt_window.destroy,
-            font=self.fonts["normal"],
-            bg=self.colors["primary"],
-            fg="white",
-            padx=20,
-            pady=8
+            style="Receipt.TButton"
         ).pack(pady=(20, 0))
 
     def quick_park(self, vehicle_type):
         """Quick park a random vehicle"""
-        letters = ''.join(random.choices('ABCDEFGHIJKLMNOPQRSTUVWXYZ', k=3))
-        numbers = ''.join(random.choices('0123456789', k=3))
-        vehicle_id = f"{letters}{numbers}"
-
-        first_names = ["John", "Jane", "Robert", "Emily", "Michael",
-                       "Sarah", "David", "Lisa"]
-        last_names = ["Smith", "Johnson", "Williams", "Brown", "Jones",
-                      "Garcia", "Miller", "Davis"]
-        owner = f"{random.choice(first_names)} {random.choice(last_names)}"
-
-        if vehicle_type == VehicleType.CAR:
-            vehicle = Car(vehicle_id, owner)
-        elif vehicle_type == VehicleType.BIKE:
-            vehicle = Bike(vehicle_id, owner)
-        elif vehicle_type == VehicleType.TRUCK:
-            vehicle = Truck(vehicle_id, owner)
-        elif vehicle_type == VehicleType.SUV:
-            vehicle = SUV(vehicle_id, owner)
+        vehicle_id = sys.intern(_random_vehicle_id())
+        owner = _random_owner()
+
+        vehicle = _VEHICLE_CTOR[vehicle_type](vehicle_id, owner)
 
         try:
-            slot_number = self.parking_lot.park_vehicle(vehicle)
+            slot_number = self.parking_lot.park_vehicle(vehicle, self._now())
 
-            self.update_display()
+            self._apply_park(vehicle)
 
             messagebox.showinfo(
                 "Quick Park",
@@ -1151,19 +1304,31 @@ class AutomatedParkingLotSystem:
         )
 
         if response:
-            while self.parking_lot.vehicles:
-                vehicle_id = list(self.parking_lot.vehicles.keys())[0]
+            self._bulk_clear(list(self.parking_lot.vehicles))
+
+    def _bulk_clear(self, vehicle_ids, start=0):
+        """Remove vehicles a chunk at a time between GUI events"""
+        end = start + CLEAR_CHUNK_SIZE
+        removed = []
+        with self._batched():
+            for vehicle_id in vehicle_ids[start:end]:
                 try:
-                    self.parking_lot.remove_vehicle(vehicle_id)
+                    vehicle, _ = self.parking_lot.remove_vehicle(
+                        vehicle_id, self._now())
                 except Exception:
-                    pass
+                    continue
+                removed.append(vehicle)
 
-            self.update_display()
+            self._apply_remove(*removed)
 
-            messagebox.showinfo(
-                "Cleared",
-                "All vehicles have been cleared from the parking lot."
-            )
+        if end < len(vehicle_ids):
+            self.root.after_idle(self._bulk_clear, vehicle_ids, end)
+            return
+
+        messagebox.showinfo(
+            "Cleared",
+            "All vehicles have been cleared from the parking lot."
+        )
 
     def reset_parking_lot(self):
         """Reset the parking lot (new day)"""
@@ -1174,40 +1339,97 @@ class AutomatedParkingLotSystem:
         )
 
         if response:
-            self.parking_lot.reset()
-            self.update_display()
+            with self._batched():
+                self.parking_lot.reset()
+                self._clear_vehicle_list()
+                self.update_display()
             messagebox.showinfo("Reset",
                                 "Parking lot has been reset.")
 
-    def update_display(self):
-        """Update all display elements"""
-        self.draw_parking_lot()
+    @contextmanager
+    def _batched(self):
+        """Defer display updates until the block finishes"""
+        self._batching = True
+        try:
+            yield
+        finally:
+            self._batching = False
+            self._flush()
+
+    def _flush(self):
+        """Apply display updates deferred by _batched() in one pass"""
+        if not self._display_dirty:
+            return
+
+        slots = sorted(self._dirty_slots)
+        self._dirty_slots.clear()
+        self._display_dirty = False
+
+        self.update_display(slots)
+        self.parking_canvas.update_idletasks()
+
+    def update_display(self, slots=None):
+        """Update all display elements, redrawing only the given slots"""
+        if slots is None:
+            slots = range(1, self.parking_lot.capacity + 1)
+
+        if self._batching:
+            self._dirty_slots.update(slots)
+            self._display_dirty = True
+            return
 
-        available = len(self.parking_lot.get_available_slots())
-        occupied = len(self.parking_lot.get_occupied_slots())
+        for slot_num in slots:
+            self.redraw_slot(slot_num)
+
+        if not self._stats_pending:
+            self._stats_pending = True
+            self.root.after_idle(self._flush_stats)
+
+    def _flush_stats(self):
+        """Write the statistics panel and header status once per idle"""
+        self._stats_pending = False
+
+        occupied = self.parking_lot.occupied_count
+        available = self.parking_lot.capacity - occupied
         occupancy_rate = self.parking_lot.get_occupancy_rate()
 
-        self.available_slots_var.set(str(available))
-        self.occupied_slots_var.set(str(occupied))
-        self.occupancy_var.set(f"{occupancy_rate:.1f}%")
-        self.revenue_var.set(f"${self.parking_lot.revenue:.2f}")
-        self.total_vehicles_var.set(str(self.parking_lot.total_vehicles))
-
-        for item in self.vehicles_tree.get_children():
-            self.vehicles_tree.delete(item)
-
-        for vehicle in self.parking_lot.vehicles.values():
-            vehicle_data = vehicle.to_dict()
-            self.vehicles_tree.insert(
-                "", tk.END,
-                values=(
-                    vehicle_data["slot"],
-                    vehicle_data["id"],
-                    vehicle_data["type"],
-                    vehicle_data["owner"],
-                    vehicle_data["entry_time"]
-                )
+        self._set_var(self.available_slots_var, str(available))
+        self._set_var(self.occupied_slots_var, str(occupied))
+        self._set_var(self.occupancy_var, f"{occupancy_rate:.1f}%")
+        self._set_var(self.revenue_var, f"${self.parking_lot.revenue:.2f}")
+        self._set_var(self.total_vehicles_var,
+                      str(self.parking_lot.total_vehicles))
+        self.update_status()
+
+    def _apply_park(self, vehicle):
+        """Show a newly parked vehicle in the list and on the canvas"""
+        vehicle_data = vehicle.to_dict()
+        self._tree_iids[vehicle.vehicle_id] = self.vehicles_tree.insert(
+            "", tk.END,
+            values=(
+                vehicle_data["slot"],
+                vehicle_data["id"],
+                vehicle_data["type"],
+                vehicle_data["owner"],
+                vehicle_data["entry_time"]
             )
+        )
+        self.update_display([vehicle.slot_number])
+
+    def _apply_remove(self, *vehicles):
+        """Drop departed vehicles from the list and the canvas"""
+        iids = [self._tree_iids.pop(vehicle.vehicle_id)
+                for vehicle in vehicles
+                if vehicle.vehicle_id in self._tree_iids]
+        if iids:
+            self.vehicles_tree.delete(*iids)
+        self.update_display([vehicle.slot_number for vehicle in vehicles])
+
+    def _clear_vehicle_list(self):
+        """Remove every row from the vehicle list"""
+        if self._tree_iids:
+            self.vehicles_tree.delete(*self._tree_iids.values())
+            self._tree_iids.clear()
 
 def main():
     """Main function to run the application"""